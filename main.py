@@ -1,40 +1,140 @@
 #!/usr/bin/env python3
-import paramiko
+# SSH后端选用asyncssh：单事件循环内epoll复用所有主机连接。
+# 曾评估ssh2-python(libssh2绑定)的更低单命令开销，但其阻塞式API需要
+# 线程池或自建selector循环才能并发轮询多主机，与本监控的asyncio架构
+# 冲突，收益不抵复杂度，故不采用。
+import asyncssh
+import asyncio
+import re
+import sys
 import time
 import json
 import os
-import threading
 from typing import Dict, Tuple, List
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 
 P_PATH = os.path.dirname(os.path.abspath(__file__))
 
+# orjson可用时走其字节解析路径（配置重载时快2-3倍），否则退回标准库json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # 配置日志记录器
 def setup_logger():
     logger = logging.getLogger('ssh_monitor')
     logger.setLevel(logging.INFO)
-    
+
     # 创建文件处理器
     log_file = os.path.join(P_PATH, 'ssh_monitor.log')
     file_handler = logging.FileHandler(log_file)
     file_handler.setLevel(logging.INFO)
-    
+
     # 设置日志格式
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     file_handler.setFormatter(formatter)
-    
+
     # 添加处理器到记录器
     logger.addHandler(file_handler)
-    
+
     return logger
 
 logger = setup_logger()
 
+# 预编译的指标解析正则：每秒每台服务器都要解析，避免重复的split/逐行扫描
+_MEM_RE = re.compile(r'MemTotal:\s+(\d+).*?MemFree:\s+(\d+)(?:.*?MemAvailable:\s+(\d+))?', re.S)
+_CPU_RE = re.compile(r'cpu\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)(?:\s+(\d+))?')
+_SECTION_RE = re.compile(r'===(CPU|MEM|DISK)===\n?')
+
+class SSHConnectionPool:
+    """按(用户, 主机, 端口)复用SSH连接的连接池
+
+    同一主机以不同名称被监控时共享同一条连接；连接带引用计数，
+    引用归零且空闲超过TTL才真正关闭。对反复拨号失败的主机做
+    指数退避快速失败，避免死主机拖慢整个轮询。
+    """
+
+    def __init__(self, idle_ttl: float = 60.0):
+        self.idle_ttl = idle_ttl
+        self._entries = {}  # key -> [conn, refcount, last_used]
+        self._next_dial = {}  # key -> 下次允许拨号的monotonic时间
+        self._fail_counts = {}
+        self._lock = asyncio.Lock()
+        self.logger = logging.getLogger('ssh_monitor')
+
+    async def get(self, key: Tuple[str, str, int], factory) -> 'asyncssh.SSHClientConnection':
+        """获取key对应的连接，复用存活连接，必要时通过factory新建"""
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                if not entry[0].is_closed():
+                    entry[1] += 1
+                    entry[2] = time.monotonic()
+                    return entry[0]
+                # 传输层已死，丢弃后重新拨号
+                del self._entries[key]
+
+            now = time.monotonic()
+            if now < self._next_dial.get(key, 0):
+                raise ConnectionError(f"Connection to {key[1]} backing off after repeated failures")
+
+            try:
+                conn = await factory()
+            except Exception:
+                fails = self._fail_counts.get(key, 0) + 1
+                self._fail_counts[key] = fails
+                self._next_dial[key] = now + min(60, 2 ** fails)
+                raise
+
+            self._fail_counts.pop(key, None)
+            self._next_dial.pop(key, None)
+            self._entries[key] = [conn, 1, now]
+            return conn
+
+    async def release(self, key: Tuple[str, str, int]):
+        """归还连接；引用归零且空闲超过TTL才实际关闭"""
+        async with self._lock:
+            entry = self._entries.get(key)
+            if not entry:
+                return
+
+            entry[1] = max(0, entry[1] - 1)
+            if entry[1] == 0 and time.monotonic() - entry[2] > self.idle_ttl:
+                del self._entries[key]
+                entry[0].close()
+                await entry[0].wait_closed()
+                self.logger.info(f"Closed idle pooled connection to {key[1]}")
+
+    async def close_all(self):
+        """关闭池内全部连接（进程退出时调用）
+
+        release的TTL判断只发生在归还瞬间，零引用但未到空闲时限的连接
+        会留在池里等复用，没有后台清扫，必须在退出时统一关闭。
+        """
+        async with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            for entry in entries:
+                entry[0].close()
+            for entry in entries:
+                await entry[0].wait_closed()
+            if entries:
+                self.logger.info(f"Closed {len(entries)} pooled connection(s)")
+
+_pool = SSHConnectionPool()
+
 class SSHMonitor:
-    def __init__(self, name: str, hostname: str, username: str, password: str = None, 
-                 key_filename: str = None, port: int = 22, timeout: int = 5):
+    # 预绑定的状态行格式化函数，避免每次轮询重新解释f-string格式说明符
+    _STATUS_FMT = "{:<12} {:4.1f}%  {:5.1f}/{:.1f}GB  {}/{}".format
+
+    # 各指标缓存的默认TTL（秒）：CPU每秒都变，内存较慢，磁盘近乎静态
+    _DEFAULT_TTL = {'cpu': 1, 'mem': 2, 'disk': 15}
+
+    def __init__(self, name: str, hostname: str, username: str, password: str = None,
+                 key_filename: str = None, port: int = 22, timeout: int = 5,
+                 ttl: Dict[str, float] = None):
         self.name = name
         self.hostname = hostname
         self.username = username
@@ -42,72 +142,190 @@ class SSHMonitor:
         self.key_filename = key_filename
         self.port = port
         self.timeout = timeout
-        self.client = None
-        self._lock = threading.Lock()
+        self.ttl = {**self._DEFAULT_TTL, **(ttl or {})}
+        self.conn = None
+        self._mem_total_kb = None
+        self._disk_cache = None
+        self._last_cpu = None
+        # 各指标的缓存值及其过期时刻：未过期的指标直接用缓存，不发SSH命令
+        self._cached_cpu = 0.0
+        self._cached_mem = None
+        self._metric_deadline = {'cpu': 0.0, 'mem': 0.0, 'disk': 0.0}
+        # 连接异常时显示的占位行内容固定，构造时算好
+        self._unknown_row = f"{self.name:<12} {'?':>4}    {'?':>5}/{'?':>5}GB    {'?'}/{'?'}"
+        # 连续失败后的重试退避：_next_attempt之前不再碰这台主机
+        self._fail_count = 0
+        self._next_attempt = 0.0
         self.logger = logging.getLogger('ssh_monitor')
 
-    def connect(self):
-        """建立SSH连接"""
-        if self.client and self.client.get_transport() and self.client.get_transport().is_active():
+    @property
+    def _pool_key(self) -> Tuple[str, str, int]:
+        return (self.username, self.hostname, self.port)
+
+    async def _dial(self) -> 'asyncssh.SSHClientConnection':
+        """实际新建一条SSH连接（由连接池调用）"""
+        return await asyncssh.connect(
+            host=self.hostname,
+            username=self.username,
+            password=self.password,
+            client_keys=[self.key_filename] if self.key_filename else None,
+            port=self.port,
+            known_hosts=None,
+            connect_timeout=self.timeout
+        )
+
+    async def connect(self):
+        """从连接池获取SSH连接"""
+        if self.conn and not self.conn.is_closed():
             return
 
         try:
-            self.client = paramiko.SSHClient()
-            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            self.client.connect(
-                hostname=self.hostname,
-                username=self.username,
-                password=self.password,
-                key_filename=self.key_filename,
-                port=self.port,
-                timeout=self.timeout
-            )
+            self.conn = await _pool.get(self._pool_key, self._dial)
+            # 只记日志不打印：表头绘制后屏幕由光标定位重绘接管，
+            # 中途print会在任意位置插行并可能滚屏，错位无法自愈
             self.logger.info(f"Successfully connected to {self.hostname}")
-            print(f"Successfully connected to {self.hostname}")
         except Exception as e:
             self.logger.error(f"Failed to connect to {self.hostname}: {str(e)}")
             raise
 
-    def disconnect(self):
-        """断开SSH连接"""
-        if self.client:
+    async def disconnect(self):
+        """归还SSH连接给连接池"""
+        if self.conn:
             try:
-                self.client.close()
+                await _pool.release(self._pool_key)
+                self.conn = None
                 self.logger.info(f"Disconnected from {self.hostname}")
             except Exception as e:
                 self.logger.error(f"Error disconnecting from {self.hostname}: {str(e)}")
 
-    def execute_command(self, command: str) -> str:
-        """执行SSH命令"""
-        with self._lock:
-            try:
-                if not self.client or not self.client.get_transport() or not self.client.get_transport().is_active():
-                    self.logger.warning(f"Connection lost to {self.hostname}, attempting to reconnect")
-                    self.connect()
-                
-                stdin, stdout, stderr = self.client.exec_command(command)
-                output = stdout.read().decode().strip()
-                error = stderr.read().decode().strip()
-                
+    async def execute_command(self, command: str, debug: bool = False) -> str:
+        """执行SSH命令
+
+        指标命令正常不产生stderr，默认直接丢弃以省掉一路流的收集；
+        排障时传debug=True保留stderr并记录日志。
+
+        每条命令在共享连接上打开独立的会话通道，asyncssh在单事件循环内
+        多路复用，无并发线程访问，因此不需要paramiko时代的互斥锁。
+        """
+        try:
+            if not self.conn or self.conn.is_closed():
+                self.logger.warning(f"Connection lost to {self.hostname}, attempting to reconnect")
+                self.conn = None
+                await self.connect()
+
+            if debug:
+                result = await self.conn.run(command)
+                error = result.stderr.strip()
                 if error:
                     self.logger.warning(f"Command '{command}' on {self.hostname} produced error: {error}")
-                
-                return output
-            except Exception as e:
-                self.logger.error(f"Error executing command '{command}' on {self.hostname}: {str(e)}")
-                raise
+            else:
+                # 在通道层丢弃stderr：追加2>/dev/null只作用于复合命令的
+                # 最后一个简单命令，且asyncssh照样收集stderr流进内存
+                result = await self.conn.run(command, stderr=asyncssh.DEVNULL)
+
+            return result.stdout.strip()
+        except Exception as e:
+            self.logger.error(f"Error executing command '{command}' on {self.hostname}: {str(e)}")
+            raise
 
-    def get_cpu_usage(self) -> float:
+    # 批量采集的各段命令：单次命令获取全部指标，避免每个指标各开一个SSH通道
+    # CPU直接采样/proc/stat并与上次采样做差值，不用top -bn1（内部睡眠约1秒）
+    _CPU_CMD = "head -n1 /proc/stat"
+    # 直接读/proc/meminfo，单次文件读取，不走free|grep|awk三个远端进程
+    _MEM_CMD = "grep -E '^(MemTotal|MemFree|MemAvailable):' /proc/meminfo"
+    # 磁盘：首次全量df建立挂载点映射，之后只刷新状态行实际使用的根分区
+    _DISK_FULL_CMD = "df -h | grep '^/dev'"
+    _DISK_ROOT_CMD = "df -h --output=target,pcent,used,size /"
+
+    # 各指标段在类定义时拼好，热路径只在过期的段之间做一次join，
+    # 不在每次轮询重复构造命令字符串
+    _CPU_SEG = f"printf '===CPU===\\n'; {_CPU_CMD}"
+    _MEM_SEG = f"printf '===MEM===\\n'; {_MEM_CMD}"
+    _DISK_SEG_FULL = f"printf '===DISK===\\n'; {_DISK_FULL_CMD}"
+    _DISK_SEG_ROOT = f"printf '===DISK===\\n'; {_DISK_ROOT_CMD}"
+
+    async def get_all_stats(self) -> Tuple[float, Dict[str, float], Dict[str, Dict[str, float]]]:
+        """批量获取CPU、内存和磁盘状态，只采集TTL已过期的指标
+
+        各指标的波动速度差异很大，按TTL分层：未过期的指标直接返回缓存值，
+        命令里只包含过期的段；全部命中缓存时这一轮完全不发SSH命令。
+        """
+        now = time.monotonic()
+        need_cpu = now >= self._metric_deadline['cpu']
+        need_mem = now >= self._metric_deadline['mem'] or self._cached_mem is None
+        need_disk = now >= self._metric_deadline['disk'] or self._disk_cache is None
+
+        segments = []
+        if need_cpu:
+            segments.append(self._CPU_SEG)
+        if need_mem:
+            segments.append(self._MEM_SEG)
+        if need_disk:
+            segments.append(self._DISK_SEG_FULL if self._disk_cache is None
+                            else self._DISK_SEG_ROOT)
+
+        if segments:
+            output = await self.execute_command('; '.join(segments))
+            parts = _SECTION_RE.split(output)
+            sections = dict(zip(parts[1::2], parts[2::2]))
+
+            if need_cpu:
+                self._cached_cpu = self._parse_cpu(sections.get('CPU', '').strip())
+                self._metric_deadline['cpu'] = now + self.ttl['cpu']
+            if need_mem:
+                self._cached_mem = self._parse_memory(sections.get('MEM', '').strip())
+                self._metric_deadline['mem'] = now + self.ttl['mem']
+            if need_disk:
+                disk_part = sections.get('DISK', '').strip()
+                if self._disk_cache is None:
+                    self._disk_cache = self._parse_disk(disk_part)
+                else:
+                    self._update_root_disk(disk_part)
+                self._metric_deadline['disk'] = now + self.ttl['disk']
+
+        return (self._cached_cpu, self._cached_mem, self._disk_cache)
+
+    def _parse_cpu(self, output: str) -> float:
+        """由/proc/stat两次采样的差值计算CPU使用率"""
+        groups = _CPU_RE.search(output).groups()
+        user, nice, system, idle_time, iowait, irq, softirq = map(int, groups[:7])
+        # steal计入total（虚机上非零），旧内核没有该字段时按0处理；
+        # guest/guest_nice已含在user/nice里，不再重复累加
+        steal = int(groups[7] or 0)
+        # idle计入iowait，total为全部时间片之和
+        idle = idle_time + iowait
+        total = user + nice + system + idle_time + iowait + irq + softirq + steal
+
+        if self._last_cpu is None:
+            # 首次采样没有差值基准，下一轮起才有有效读数
+            self._last_cpu = (total, idle)
+            return 0.0
+
+        last_total, last_idle = self._last_cpu
+        self._last_cpu = (total, idle)
+
+        total_delta = total - last_total
+        if total_delta <= 0:
+            return 0.0
+        return 100.0 * (1 - (idle - last_idle) / total_delta)
+
+    async def get_cpu_usage(self) -> float:
         """获取CPU使用率"""
-        cmd = "top -bn1 | grep 'Cpu(s)' | awk '{print $2}'"
-        cpu_usage = float(self.execute_command(cmd))
-        return cpu_usage
+        return self._parse_cpu(await self.execute_command(self._CPU_CMD))
+
+    def _parse_memory(self, output: str) -> Dict[str, float]:
+        """解析/proc/meminfo输出"""
+        match = _MEM_RE.search(output)
+
+        # 内存总量不会变化，首次解析后缓存，之后只依赖快变字段
+        if self._mem_total_kb is None:
+            self._mem_total_kb = int(match.group(1))
+
+        total = self._mem_total_kb
+        # 旧内核没有MemAvailable时退回MemFree
+        free = int(match.group(3) or match.group(2))
+        used = total - free
 
-    def get_memory_usage(self) -> Dict[str, float]:
-        """获取内存使用情况"""
-        cmd = "free | grep Mem | awk '{print $2,$3,$4}'"
-        total, used, free = map(int, self.execute_command(cmd).split())
-        
         memory_info = {
             'total_mb': total / 1024,
             'used_mb': used / 1024,
@@ -116,12 +334,15 @@ class SSHMonitor:
         }
         return memory_info
 
-    def get_disk_usage(self) -> Dict[str, Dict[str, float]]:
-        """获取磁盘使用情况"""
-        cmd = "df -h | grep '^/dev'"
+    async def get_memory_usage(self) -> Dict[str, float]:
+        """获取内存使用情况"""
+        return self._parse_memory(await self.execute_command(self._MEM_CMD))
+
+    def _parse_disk(self, output: str) -> Dict[str, Dict[str, float]]:
+        """解析磁盘使用情况输出"""
         disk_info = {}
-        
-        for line in self.execute_command(cmd).splitlines():
+
+        for line in output.splitlines():
             parts = line.strip().split()
             if len(parts) >= 6:
                 filesystem = parts[0]
@@ -130,7 +351,7 @@ class SSHMonitor:
                 available = parts[3]
                 usage_percent = float(parts[4].strip('%'))
                 mount_point = parts[5]
-                
+
                 disk_info[mount_point] = {
                     'filesystem': filesystem,
                     'total': total,
@@ -140,54 +361,82 @@ class SSHMonitor:
                 }
         return disk_info
 
-    def format_status_line(self) -> str:
+    def _update_root_disk(self, output: str):
+        """用根分区的df输出刷新缓存的磁盘映射"""
+        lines = output.splitlines()
+        if len(lines) < 2:
+            return
+
+        target, pcent, used, size = lines[-1].split()
+        entry = self._disk_cache.setdefault(target, {'filesystem': '', 'available': ''})
+        entry.update({
+            'total': size,
+            'used': used,
+            'usage_percent': float(pcent.strip('%'))
+        })
+
+    async def get_disk_usage(self) -> Dict[str, Dict[str, float]]:
+        """获取磁盘使用情况"""
+        if self._disk_cache is None:
+            self._disk_cache = self._parse_disk(await self.execute_command(self._DISK_FULL_CMD))
+        else:
+            self._update_root_disk(await self.execute_command(self._DISK_ROOT_CMD))
+        return self._disk_cache
+
+    async def format_status_line(self) -> str:
         """格式化单行状态信息"""
+        # 退避期内直接返回占位行，不向故障主机发起任何连接或命令
+        if time.monotonic() < self._next_attempt:
+            return self._unknown_row
+
         try:
-            if not self.client or not self.client.get_transport() or not self.client.get_transport().is_active():
-                return f"{self.name:<12} {'?':>4}    {'?':>5}/{'?':>5}GB    {'?'}/{'?'}"
+            cpu_usage, memory_usage, disk_usage = await self.get_all_stats()
 
-            cpu_usage = self.get_cpu_usage()
-            memory_usage = self.get_memory_usage()
-            disk_usage = self.get_disk_usage()
-            
             # 获取主要磁盘分区（根目录）的使用情况
             root_disk = disk_usage.get('/', disk_usage.get(list(disk_usage.keys())[0]))
-            
+
             # 转换内存单位从MB到GB
             used_gb = memory_usage['used_mb'] / 1024
             total_gb = memory_usage['total_mb'] / 1024
-            
-            return (f"{self.name:<12} "
-                   f"{cpu_usage:4.1f}%  "
-                   f"{used_gb:5.1f}/{total_gb:.1f}GB  "
-                   f"{root_disk['used']}/{root_disk['total']}")
+
+            self._fail_count = 0
+            self._next_attempt = 0.0
+            return SSHMonitor._STATUS_FMT(
+                self.name, cpu_usage, used_gb, total_gb,
+                root_disk['used'], root_disk['total'])
         except Exception as e:
             self.logger.error(f"Error formatting status line for {self.name}: {str(e)}")
-            return f"{self.name:<12} {'?':>4}    {'?':>5}/{'?':>5}GB    {'?'}/{'?'}"
+            # 连续失败按指数拉长重试间隔，上限60秒，避免死主机拖慢整帧
+            self._fail_count += 1
+            self._next_attempt = time.monotonic() + min(60, 2 ** self._fail_count)
+            return self._unknown_row
 
 class MultiServerMonitor:
     def __init__(self, config_file: str):
         self.config_file = config_file
         self.monitors: List[SSHMonitor] = []
-        self.executor = ThreadPoolExecutor(max_workers=10)
         self.running = True
         self.logger = logging.getLogger('ssh_monitor')
         self.load_config()
+        # 预分配按索引对齐的行缓存，轮询循环复用，避免每帧的dict分配和查找
+        self._row_cache: List[str] = [""] * len(self.monitors)
+        self._last_rendered: List[str] = [None] * len(self.monitors)
 
     def load_config(self):
         """加载配置文件"""
         try:
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
-            
+            with open(self.config_file, 'rb') as f:
+                config = _json_loads(f.read())
+
             self.logger.info(f"Loading configuration from {self.config_file}")
-            
+
             global_config = config.get('global', {})
             default_username = global_config.get('username')
             default_password = global_config.get('password')
             default_key_filename = global_config.get('key_filename')
             default_port = global_config.get('port', 22)
             default_timeout = global_config.get('timeout', 5)
+            default_ttl = global_config.get('ttl', {})
 
             # 展开key_filename中的~为实际的家目录路径
             if default_key_filename and '~' in default_key_filename:
@@ -209,7 +458,8 @@ class MultiServerMonitor:
                     password=server.get('password', default_password),
                     key_filename=key_filename,
                     port=server.get('port', default_port),
-                    timeout=server.get('timeout', default_timeout)
+                    timeout=server.get('timeout', default_timeout),
+                    ttl={**default_ttl, **server.get('ttl', {})}
                 )
                 self.monitors.append(monitor)
                 self.logger.debug(f"Added monitor for server {server['name']}")
@@ -217,32 +467,38 @@ class MultiServerMonitor:
             self.logger.error(f"Error loading configuration: {str(e)}")
             raise
 
-    def connect_all(self):
-        """并行连接所有服务器"""
-        def connect_server(monitor):
-            try:
-                monitor.connect()
-                return True
-            except Exception as e:
-                self.logger.error(f"Failed to connect to {monitor.name}: {str(e)}")
-                return False
+    async def connect_all(self):
+        """并行连接所有服务器
 
-        futures = []
+        不同主机的连接完全并发；同一主机（同一个sshd）的连接串行，
+        避免超过OpenSSH默认的MaxStartups 10后未认证连接被静默丢弃。
+        """
+        semaphores = {}
         for monitor in self.monitors:
-            futures.append(self.executor.submit(connect_server, monitor))
-        
-        # 等待所有连接完成
-        for future in as_completed(futures):
-            future.result()
+            semaphores.setdefault(monitor.hostname, asyncio.Semaphore(1))
 
-    def disconnect_all(self):
+        async def connect_server(monitor):
+            async with semaphores[monitor.hostname]:
+                await monitor.connect()
+
+        results = await asyncio.gather(
+            *(connect_server(monitor) for monitor in self.monitors),
+            return_exceptions=True
+        )
+        for monitor, result in zip(self.monitors, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to connect to {monitor.name}: {str(result)}")
+
+    async def disconnect_all(self):
         """断开所有服务器连接"""
         self.logger.info("Disconnecting from all servers")
         for monitor in self.monitors:
             try:
-                monitor.disconnect()
+                await monitor.disconnect()
             except Exception as e:
                 self.logger.error(f"Error disconnecting from {monitor.name}: {str(e)}")
+        # 归还只减引用计数，未到空闲时限的连接仍留在池里，退出前统一关闭
+        await _pool.close_all()
 
     def clear_line(self):
         """清除当前行"""
@@ -255,72 +511,67 @@ class MultiServerMonitor:
         else:
             print(f'\033[{-lines}A', end='')  # 向上移动
 
-    def clear_screen(self):
-        """清除屏幕内容"""
-        if not hasattr(self, '_first_clear'):
-            print("\033[2J\033[H", end="")
-            self._first_clear = True
-        else:
-            # 移动到开头并清除之后的所有行
-            print("\033[H", end="")
+    # 表头布局：空行+两行标题+分隔线+时间行+空行，数据行从第7行开始
+    _TS_LINE = 5
+    _HEADER_LINES = 6
 
     def print_header(self):
-        """打印表头"""
+        """清屏并打印表头（只在监控开始时输出一次，之后不再重绘）"""
+        print("\033[2J\033[H", end="")
         print("\nServer        CPU    Memory       Disk")
         print("             Usage   Used/Total    Used/Total")
         print("-" * 50)
 
-    def get_server_status(self, monitor: SSHMonitor) -> Tuple[str, str]:
-        """获取单个服务器状态"""
-        return monitor.name, monitor.format_status_line()
+    async def _poll_row(self, index: int):
+        """采集第index个监控器的状态并写入行缓存对应位置"""
+        self._row_cache[index] = await self.monitors[index].format_status_line()
 
-    def monitor_all(self, interval: int = 1):
+    async def monitor_all(self, interval: int = 1):
         """监控所有服务器"""
         try:
+            self.print_header()
             while self.running:
-                self.clear_screen()
-                self.print_header()
-                current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                print(f"Last Update: {current_time}\n")
-
-                # 并行获取所有服务器状态
-                server_status = {}  # 用于存储状态和保持顺序
-                futures_dict = {}  # 用于跟踪future和monitor的关系
-                
-                for monitor in self.monitors:
-                    future = self.executor.submit(self.get_server_status, monitor)
-                    futures_dict[future] = monitor
-
-                # 收集结果
-                for future in as_completed(futures_dict):
-                    monitor = futures_dict[future]
-                    _, status = future.result()
-                    server_status[monitor] = status
-
-                # 按照原始顺序显示结果
-                for monitor in self.monitors:
-                    if monitor in server_status:
-                        print(server_status[monitor])
-
-                time.sleep(interval)
+                current_time = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime())
+
+                # 单事件循环并发采集，各协程按索引写入预分配的行缓存
+                await asyncio.gather(
+                    *(self._poll_row(index) for index in range(len(self.monitors)))
+                )
+
+                # 整帧攒成一个字符串一次写出，每帧只有一次write+flush；
+                # 未变化的行不进帧，不产生任何终端写入
+                frame = [f"\033[{self._TS_LINE};1H\033[KLast Update: {current_time}"]
+                for index, status in enumerate(self._row_cache):
+                    if self._last_rendered[index] == status:
+                        continue
+                    self._last_rendered[index] = status
+                    frame.append(f"\033[{index + self._HEADER_LINES + 1};1H\033[K{status}")
+
+                sys.stdout.write(''.join(frame))
+                sys.stdout.flush()
+                await asyncio.sleep(interval)
 
         except KeyboardInterrupt:
             print("\nMonitoring stopped by user")
         finally:
             print('\033[?25h', end='')  # 恢复光标
-            self.disconnect_all()
+            await self.disconnect_all()
 
-def main():
+async def async_main():
     config_file = os.path.join(P_PATH, "config.json")
-    
+
     multi_monitor = MultiServerMonitor(config_file)
     try:
-        multi_monitor.connect_all()
-        multi_monitor.monitor_all(interval=1)
+        await multi_monitor.connect_all()
+        await multi_monitor.monitor_all(interval=1)
+    finally:
+        await multi_monitor.disconnect_all()
+
+def main():
+    try:
+        asyncio.run(async_main())
     except KeyboardInterrupt:
         print("\nProgram terminated by user")
-    finally:
-        multi_monitor.disconnect_all()
 
 if __name__ == "__main__":
     main()